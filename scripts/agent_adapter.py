@@ -4,6 +4,30 @@ import json
 import sys
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj):
+    """Serialize obj to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS turns int keys into strings, as json.dumps does
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Types orjson rejects; let json.dumps serialize or reject them
+            pass
+    return json.dumps(obj)
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Default install location of the morgana binary, expanded once at import
+_MORGANA_BIN = os.path.expanduser("~/.claude/morgana-protocol/dist/morgana")
+
+
 def AgentAdapter(agent_type, prompt, **kwargs):
     """
     Adapter using Morgana Protocol - bridges specialized agents with Claude Code's Task tool
@@ -16,11 +40,8 @@ def AgentAdapter(agent_type, prompt, **kwargs):
     Returns:
         str: Agent execution result
     """
-    # Find morgana binary
-    morgana_bin = os.path.expanduser("~/.claude/morgana-protocol/dist/morgana")
-    if not os.path.exists(morgana_bin):
-        # Try PATH
-        morgana_bin = "morgana"
+    # Find morgana binary, falling back to PATH
+    morgana_bin = _MORGANA_BIN if os.path.exists(_MORGANA_BIN) else "morgana"
     
     # Build command
     cmd = [morgana_bin, "--"]
@@ -30,27 +51,27 @@ def AgentAdapter(agent_type, prompt, **kwargs):
     # Add any additional options as JSON in environment
     env = os.environ.copy()
     if kwargs:
-        env["MORGANA_OPTIONS"] = json.dumps(kwargs)
+        env["MORGANA_OPTIONS"] = _json_dumps(kwargs)
     
     # Execute
     try:
         proc = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
             env=env
         )
         
-        # Parse output
-        result = json.loads(proc.stdout)
+        # Parse output straight from bytes - no separate decode pass
+        result = _json_loads(proc.stdout)
         if result.get("success"):
             return result["results"][0]["output"]
         else:
             raise Exception(f"Morgana execution failed: {result}")
             
     except subprocess.CalledProcessError as e:
-        raise Exception(f"Morgana failed with code {e.returncode}: {e.stderr}")
+        stderr = e.stderr.decode("utf-8", errors="replace") if e.stderr else ""
+        raise Exception(f"Morgana failed with code {e.returncode}: {stderr}")
     except json.JSONDecodeError as e:
         raise Exception(f"Failed to parse Morgana output: {e}")
 
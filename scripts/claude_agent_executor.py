@@ -6,51 +6,182 @@ This executor directly calls Claude Code's Task tool and logs events using morga
 Designed to work within Claude Code REPL environment without subprocess or file-based communication.
 """
 
+import json
 import os
+import reprlib
 import sys
 import time
-import uuid
-from typing import Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 
-# Import morgana events for logging
+# orjson is optional - fall back to the stdlib json module
 try:
-    from morgana_events import get_logger, log_task_start, log_task_complete, log_task_error
+    import orjson
 except ImportError:
-    print("Warning: morgana_events not available - logging disabled", file=sys.stderr)
-    get_logger = None
-    log_task_start = None
-    log_task_complete = None
-    log_task_error = None
+    orjson = None
 
-# Import command polling (optional)
-try:
-    from morgana_command_poll import get_poller, integration_check_point
-except ImportError:
-    print("Warning: morgana_command_poll not available - command polling disabled", file=sys.stderr)
-    get_poller = None
-    integration_check_point = None
+
+# Optional integrations, imported on first use by ClaudeAgentExecutor so that
+# importing this module (or running --help) doesn't pay for them
+get_logger = None
+log_task_start = None
+log_task_complete = None
+log_task_error = None
+get_poller = None
+integration_check_point = None
+_morgana_events_checked = False
+_command_poll_checked = False
+
+
+def _import_morgana_events() -> bool:
+    """Import morgana_events logging helpers once; return whether they're available."""
+    global get_logger, log_task_start, log_task_complete, log_task_error, _morgana_events_checked
+    if not _morgana_events_checked:
+        _morgana_events_checked = True
+        try:
+            from morgana_events import get_logger, log_task_start, log_task_complete, log_task_error
+        except ImportError:
+            print("Warning: morgana_events not available - logging disabled", file=sys.stderr)
+    return get_logger is not None
+
+
+def _import_command_poll() -> bool:
+    """Import morgana_command_poll helpers once; return whether they're available."""
+    global get_poller, integration_check_point, _command_poll_checked
+    if not _command_poll_checked:
+        _command_poll_checked = True
+        try:
+            from morgana_command_poll import get_poller, integration_check_point
+        except ImportError:
+            print("Warning: morgana_command_poll not available - command polling disabled", file=sys.stderr)
+    return get_poller is not None
+
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(obj: Any) -> None:
+    """Write obj to stdout as indented JSON, using orjson when available.
+    
+    The bytes go straight to the stdout file descriptor, bypassing the text
+    and buffered layers of sys.stdout.
+    """
+    data = None
+    if orjson is not None:
+        try:
+            # OPT_NON_STR_KEYS turns int keys into strings, as json.dumps does
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Types orjson rejects; let json.dumps serialize or reject them
+            pass
+    if data is None:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    
+    sys.stdout.flush()
+    fd = sys.stdout.fileno()
+    view = memoryview(data + b"\n")
+    while view:
+        view = view[os.write(fd, view):]
+
+
+class TaskStoppedError(RuntimeError):
+    """Raised when a pause/stop command halts a task around its execution."""
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Return whole milliseconds elapsed since a time.monotonic_ns() reading."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
+
+
+# Character bounds for logged task results - the event log only needs a preview
+_OUTPUT_MAX_VALUE_CHARS = 500
+_OUTPUT_MAX_CHARS = 4000
+
+
+class _OutputRepr(reprlib.Repr):
+    """reprlib.Repr that keeps every item and dict order, bounding only long values."""
+    
+    def __init__(self):
+        super().__init__()
+        self.maxstring = self.maxother = _OUTPUT_MAX_VALUE_CHARS
+        self.maxdict = self.maxlist = self.maxtuple = sys.maxsize
+        self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = sys.maxsize
+        self.maxlevel = 20
+    
+    def repr_dict(self, x, level):
+        # reprlib sorts dict keys; keep insertion order to match str(result)
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        return '{' + ', '.join(
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}" for key, value in x.items()
+        ) + '}'
+
+
+_output_repr = _OutputRepr()
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _summarize_output(result: Any) -> str:
+    """Return the text logged for a task result without stringifying it in full."""
+    if result is None:
+        return "Task completed successfully"
+    if isinstance(result, str):
+        return _truncate(result, _OUTPUT_MAX_CHARS)
+    if type(result).__str__ is not object.__str__:
+        # The object chose its own text; log that rather than its repr
+        return _truncate(str(result), _OUTPUT_MAX_CHARS)
+    return _truncate(_output_repr.repr(result), _OUTPUT_MAX_CHARS)
+
+
+# Closing instruction appended after the task in every Task prompt
+_PROMPT_SUFFIX = "\n\nPlease complete this task following your specialized role and best practices."
+
+# Task dictionary keys consumed by execute_parallel; the rest become Task parameters
+_RESERVED_TASK_KEYS = frozenset(("agent_type", "prompt", "task_id", "timeout", "model"))
 
 
 class ClaudeAgentExecutor:
     """Native Claude Code agent executor with Task tool integration."""
     
-    def __init__(self, agent_dir: str = "~/.claude/agents", log_events: bool = True, enable_command_polling: bool = True):
+    def __init__(self, agent_dir: str = "~/.claude/agents", log_events: bool = True, enable_command_polling: bool = True,
+                 max_workers: int = 16):
         """Initialize the agent executor.
         
         Args:
             agent_dir: Directory containing agent configuration files
             log_events: Whether to log events to morgana_events
             enable_command_polling: Whether to enable command polling for pause/resume control
+            max_workers: Maximum number of tasks execute_parallel runs at once
         """
         self.agent_dir = Path(os.path.expanduser(agent_dir))
-        self.log_events = log_events and get_logger is not None
+        self.log_events = log_events and _import_morgana_events()
         self.logger = get_logger() if self.log_events else None
         
         # Command polling support
-        self.command_polling = enable_command_polling and get_poller is not None
+        self.command_polling = enable_command_polling and _import_command_poll()
         self.poller = get_poller() if self.command_polling else None
         
+        # Agent config and prompt prefix caches, keyed by agent type
+        self._agent_configs: Dict[str, Tuple[Optional[int], str]] = {}
+        self._prompt_prefixes: Dict[str, Tuple[str, str]] = {}
+        
+        # Task function found by _detect_task_function (None until found)
+        self._task_func_cache: Optional[Callable] = None
+        
+        # Thread pool size for execute_parallel
+        self.max_workers = max(1, max_workers)
+        
         # Supported agent types
         self.supported_agents = {
             "code-implementer",
@@ -62,6 +193,9 @@ class ClaudeAgentExecutor:
     def _load_agent_config(self, agent_type: str) -> str:
         """Load agent configuration from markdown file.
         
+        The file contents are cached per agent type and re-read only when the
+        file's mtime changes.
+        
         Args:
             agent_type: Type of agent to load
             
@@ -70,35 +204,92 @@ class ClaudeAgentExecutor:
         """
         agent_file = self.agent_dir / f"{agent_type}.md"
         
-        if not agent_file.exists():
-            return f"You are a {agent_type} specialist agent. Complete the requested task to the best of your ability."
+        try:
+            mtime_ns = agent_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        cached = self._agent_configs.get(agent_type)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        default_config = f"You are a {agent_type} specialist agent. Complete the requested task to the best of your ability."
+        
+        if mtime_ns is None:
+            self._agent_configs[agent_type] = (None, default_config)
+            return default_config
         
         try:
             with open(agent_file, 'r', encoding='utf-8') as f:
-                return f.read()
+                agent_config = f.read()
         except Exception as e:
             print(f"Warning: Failed to load agent config for {agent_type}: {e}", file=sys.stderr)
-            return f"You are a {agent_type} specialist agent. Complete the requested task to the best of your ability."
+            return default_config
+        
+        self._agent_configs[agent_type] = (mtime_ns, agent_config)
+        return agent_config
+    
+    def _get_prompt_prefix(self, agent_type: str) -> str:
+        """Get the part of the full Task prompt that precedes the task itself.
+        
+        Args:
+            agent_type: Type of agent
+            
+        Returns:
+            Prompt prefix, rebuilt only when the agent configuration changes
+        """
+        agent_config = self._load_agent_config(agent_type)
+        
+        cached = self._prompt_prefixes.get(agent_type)
+        if cached is not None and cached[0] is agent_config:
+            return cached[1]
+        
+        prefix = f"""You are executing as the {agent_type} specialist agent.
+
+{agent_config}
+
+TASK TO COMPLETE:
+"""
+        self._prompt_prefixes[agent_type] = (agent_config, prefix)
+        return prefix
     
     def _detect_task_function(self) -> Optional[Callable]:
         """Detect if Task function is available in the current environment.
         
+        A found Task function is cached for the lifetime of the executor; call
+        invalidate_task_cache() if Task is redefined. When nothing is found the
+        lookup runs again on the next call, so Task defined later is picked up.
+        
         Returns:
             Task function if available, None otherwise
         """
-        # Check if we're in Claude Code environment by looking for Task in globals
-        frame = sys._getframe(1)
-        while frame:
-            if 'Task' in frame.f_globals:
-                return frame.f_globals['Task']
-            frame = frame.f_back
-        
-        # Also check if Task is available in current namespace
+        if self._task_func_cache is not None:
+            return self._task_func_cache
+        
+        task_func = None
+        
+        # Cheap namespace lookups first: builtins, then the __main__ module
         import builtins
+        main_module = sys.modules.get('__main__')
         if hasattr(builtins, 'Task'):
-            return getattr(builtins, 'Task')
+            task_func = getattr(builtins, 'Task')
+        elif main_module is not None and 'Task' in vars(main_module):
+            task_func = vars(main_module)['Task']
+        else:
+            # Check if we're in Claude Code environment by looking for Task in globals
+            frame = sys._getframe(1)
+            while frame:
+                if 'Task' in frame.f_globals:
+                    task_func = frame.f_globals['Task']
+                    break
+                frame = frame.f_back
         
-        return None
+        self._task_func_cache = task_func
+        return task_func
+    
+    def invalidate_task_cache(self) -> None:
+        """Forget the cached Task function so the next call detects it again."""
+        self._task_func_cache = None
     
     def _execute_with_command_polling(self, task_func: Callable, prompt: str, task_params: Dict[str, Any]) -> Any:
         """Execute task function with command polling integration.
@@ -112,7 +303,7 @@ class ClaudeAgentExecutor:
             Task result
             
         Raises:
-            RuntimeError: If task is stopped by command
+            TaskStoppedError: If task is stopped by command
         """
         if not self.command_polling or not integration_check_point:
             # No command polling - execute directly
@@ -122,13 +313,13 @@ class ClaudeAgentExecutor:
         # Note: This is a simple approach. In a more sophisticated implementation,
         # we might need to run the task in a separate thread and poll periodically.
         if not integration_check_point():
-            raise RuntimeError("Task stopped by command before execution")
+            raise TaskStoppedError("Task stopped by command before execution")
         
         result = task_func(prompt, **task_params)
         
         # Check again after execution
         if not integration_check_point():
-            raise RuntimeError("Task stopped by command after execution") 
+            raise TaskStoppedError("Task stopped by command after execution")
         
         return result
     
@@ -152,15 +343,44 @@ class ClaudeAgentExecutor:
         Returns:
             Dict with execution results and metadata
         """
-        # Validate agent type
+        # Validate agent type before any other work
         if agent_type not in self.supported_agents:
             raise ValueError(f"Unsupported agent type: {agent_type}. Supported: {self.supported_agents}")
         
+        return self._execute_agent(self._detect_task_function(), agent_type, prompt,
+                                   task_id, timeout, model, kwargs)
+    
+    def _execute_agent(self,
+                       task_func: Optional[Callable],
+                       agent_type: str,
+                       prompt: str,
+                       task_id: Optional[str],
+                       timeout: Optional[int],
+                       model: Optional[str],
+                       kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute an agent task with an already-resolved Task function.
+        
+        Task detection walks the caller's frames, so it has to happen on the
+        calling thread; worker threads in execute_parallel receive the result.
+        Callers are responsible for validating agent_type.
+        
+        Args:
+            task_func: Task function, or None to use the mock fallback
+            agent_type: Type of agent to execute
+            prompt: Task prompt for the agent
+            task_id: Optional task ID for tracking
+            timeout: Optional timeout in seconds
+            model: Optional model to use
+            kwargs: Additional parameters
+            
+        Returns:
+            Dict with execution results and metadata
+        """
         # Generate task ID if not provided
         if task_id is None:
-            task_id = f"{agent_type}_{str(uuid.uuid4())[:8]}"
+            task_id = f"{agent_type}_{os.urandom(4).hex()}"
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         # Log task start
         if self.log_events and log_task_start:
@@ -171,7 +391,7 @@ class ClaudeAgentExecutor:
             # Check for pause/stop commands before starting
             if self.command_polling and integration_check_point:
                 if not integration_check_point():
-                    duration_ms = int((time.time() - start_time) * 1000)
+                    duration_ms = _elapsed_ms(start_ns)
                     if self.log_events and log_task_error:
                         log_task_error(task_id, "Task stopped by command", duration_ms, "command_stop")
                     return {
@@ -184,23 +404,11 @@ class ClaudeAgentExecutor:
                         "execution_mode": "command_stopped"
                     }
             
-            # Load agent configuration
-            agent_config = self._load_agent_config(agent_type)
-            
-            # Construct full prompt for the Task tool
-            full_prompt = f"""You are executing as the {agent_type} specialist agent.
-
-{agent_config}
-
-TASK TO COMPLETE:
-{prompt}
-
-Please complete this task following your specialized role and best practices."""
-            
             # Try to execute using Claude Code's Task function
-            task_func = self._detect_task_function()
-            
             if task_func is not None:
+                # Construct full prompt for the Task tool from the cached agent prefix
+                full_prompt = self._get_prompt_prefix(agent_type) + prompt + _PROMPT_SUFFIX
+                
                 # We're in Claude Code environment - execute Task directly
                 task_params = {
                     "subagent_type": "general-purpose",
@@ -219,11 +427,10 @@ Please complete this task following your specialized role and best practices."""
                 result = self._execute_with_command_polling(task_func, full_prompt, task_params)
                 
                 # Calculate duration and log success
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = _elapsed_ms(start_ns)
                 
                 if self.log_events and log_task_complete:
-                    output = str(result) if result is not None else "Task completed successfully"
-                    log_task_complete(task_id, output, duration_ms, model)
+                    log_task_complete(task_id, _summarize_output(result), duration_ms, model)
                 
                 return {
                     "success": True,
@@ -236,15 +443,14 @@ Please complete this task following your specialized role and best practices."""
                 }
                 
             else:
-                # Fallback: Not in Claude Code environment
-                duration_ms = int((time.time() - start_time) * 1000)
+                # Fallback: Not in Claude Code environment - skip loading the agent config
+                duration_ms = _elapsed_ms(start_ns)
                 
                 fallback_result = {
                     "agent_type": agent_type,
                     "prompt": prompt,
                     "status": "mock_execution",
                     "message": "Task function not available - returning mock response",
-                    "full_prompt": full_prompt,
                     "task_params": {
                         "timeout": timeout,
                         "model": model,
@@ -266,30 +472,30 @@ Please complete this task following your specialized role and best practices."""
                     "execution_mode": "mock_fallback"
                 }
                 
-        except RuntimeError as e:
+        except TaskStoppedError as e:
             # Handle command-related stops
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = _elapsed_ms(start_ns)
+            
+            if self.log_events and log_task_error:
+                log_task_error(task_id, str(e), duration_ms, "command_stop")
+            
+            return {
+                "success": False,
+                "agent_type": agent_type,
+                "task_id": task_id,
+                "error": str(e),
+                "duration_ms": duration_ms,
+                "model": model,
+                "execution_mode": "command_stopped"
+            }
+            
+        except RuntimeError:
+            # Re-raise non-command RuntimeErrors
+            raise
             
-            if "stopped by command" in str(e):
-                if self.log_events and log_task_error:
-                    log_task_error(task_id, str(e), duration_ms, "command_stop")
-                
-                return {
-                    "success": False,
-                    "agent_type": agent_type,
-                    "task_id": task_id,
-                    "error": str(e),
-                    "duration_ms": duration_ms,
-                    "model": model,
-                    "execution_mode": "command_stopped"
-                }
-            else:
-                # Re-raise non-command RuntimeErrors
-                raise
-                
         except Exception as e:
             # Log error and return error result
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = _elapsed_ms(start_ns)
             
             if self.log_events and log_task_error:
                 log_task_error(task_id, str(e), duration_ms, "execution")
@@ -313,41 +519,68 @@ Please complete this task following your specialized role and best practices."""
         Returns:
             List of execution results
         """
-        results = []
-        
-        for task in tasks:
-            if not isinstance(task, dict):
-                results.append({
-                    "success": False,
-                    "error": "Invalid task format - must be dictionary",
-                    "task": task
-                })
-                continue
-            
-            # Extract parameters
-            agent_type = task.get("agent_type")
-            prompt = task.get("prompt")
-            
-            if not agent_type or not prompt:
-                results.append({
-                    "success": False,
-                    "error": "Missing required parameters: agent_type and prompt",
-                    "task": task
-                })
-                continue
-            
-            # Execute the task
-            result = self.execute_agent(
-                agent_type=agent_type,
-                prompt=prompt,
-                task_id=task.get("task_id"),
-                timeout=task.get("timeout"),
-                model=task.get("model"),
-                **{k: v for k, v in task.items() 
-                   if k not in ["agent_type", "prompt", "task_id", "timeout", "model"]}
-            )
+        results: list = [None] * len(tasks)
+        if not results:
+            return results
+        
+        # Resolve Task once on the calling thread - worker threads can't see its frames
+        task_func = self._detect_task_function()
+        
+        with ThreadPoolExecutor(max_workers=min(len(tasks), self.max_workers)) as pool:
+            # Validate and submit in a single pass over the batch
+            futures = {}
+            for index, task in enumerate(tasks):
+                if not isinstance(task, dict):
+                    results[index] = {
+                        "success": False,
+                        "error": "Invalid task format - must be dictionary",
+                        "task": task
+                    }
+                    continue
+                
+                # Extract parameters
+                agent_type = task.get("agent_type")
+                prompt = task.get("prompt")
+                
+                if not agent_type or not prompt:
+                    results[index] = {
+                        "success": False,
+                        "error": "Missing required parameters: agent_type and prompt",
+                        "task": task
+                    }
+                    continue
+                
+                if agent_type not in self.supported_agents:
+                    results[index] = {
+                        "success": False,
+                        "error": f"Unsupported agent type: {agent_type}. Supported: {self.supported_agents}",
+                        "task": task
+                    }
+                    continue
+                
+                future = pool.submit(
+                    self._execute_agent,
+                    task_func,
+                    agent_type,
+                    prompt,
+                    task.get("task_id"),
+                    task.get("timeout"),
+                    task.get("model"),
+                    {k: v for k, v in task.items() if k not in _RESERVED_TASK_KEYS}
+                )
+                futures[future] = index
             
-            results.append(result)
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    # Keep one failing task from taking down the batch
+                    results[index] = {
+                        "success": False,
+                        "error": str(e),
+                        "task": tasks[index]
+                    }
         
         return results
 
@@ -365,73 +598,81 @@ def get_executor() -> ClaudeAgentExecutor:
 
 
 # Convenience functions for each agent type
-def execute_code_implementer(prompt: str, **kwargs) -> Dict[str, Any]:
+def execute_code_implementer(prompt: str, *, executor: Optional[ClaudeAgentExecutor] = None,
+                             **kwargs) -> Dict[str, Any]:
     """Execute a code-implementer agent task.
     
     Args:
         prompt: Task prompt
+        executor: Executor to use instead of the global instance
         **kwargs: Additional parameters (timeout, model, etc.)
         
     Returns:
         Execution results
     """
-    return get_executor().execute_agent("code-implementer", prompt, **kwargs)
+    return (executor or get_executor()).execute_agent("code-implementer", prompt, **kwargs)
 
 
-def execute_sprint_planner(prompt: str, **kwargs) -> Dict[str, Any]:
+def execute_sprint_planner(prompt: str, *, executor: Optional[ClaudeAgentExecutor] = None,
+                           **kwargs) -> Dict[str, Any]:
     """Execute a sprint-planner agent task.
     
     Args:
         prompt: Task prompt
+        executor: Executor to use instead of the global instance
         **kwargs: Additional parameters (timeout, model, etc.)
         
     Returns:
         Execution results
     """
-    return get_executor().execute_agent("sprint-planner", prompt, **kwargs)
+    return (executor or get_executor()).execute_agent("sprint-planner", prompt, **kwargs)
 
 
-def execute_test_specialist(prompt: str, **kwargs) -> Dict[str, Any]:
+def execute_test_specialist(prompt: str, *, executor: Optional[ClaudeAgentExecutor] = None,
+                            **kwargs) -> Dict[str, Any]:
     """Execute a test-specialist agent task.
     
     Args:
         prompt: Task prompt
+        executor: Executor to use instead of the global instance
         **kwargs: Additional parameters (timeout, model, etc.)
         
     Returns:
         Execution results
     """
-    return get_executor().execute_agent("test-specialist", prompt, **kwargs)
+    return (executor or get_executor()).execute_agent("test-specialist", prompt, **kwargs)
 
 
-def execute_validation_expert(prompt: str, **kwargs) -> Dict[str, Any]:
+def execute_validation_expert(prompt: str, *, executor: Optional[ClaudeAgentExecutor] = None,
+                              **kwargs) -> Dict[str, Any]:
     """Execute a validation-expert agent task.
     
     Args:
         prompt: Task prompt
+        executor: Executor to use instead of the global instance
         **kwargs: Additional parameters (timeout, model, etc.)
         
     Returns:
         Execution results
     """
-    return get_executor().execute_agent("validation-expert", prompt, **kwargs)
+    return (executor or get_executor()).execute_agent("validation-expert", prompt, **kwargs)
 
 
-def execute_parallel_agents(tasks: list) -> list:
+def execute_parallel_agents(tasks: list, executor: Optional[ClaudeAgentExecutor] = None) -> list:
     """Execute multiple agent tasks in parallel.
     
     Args:
         tasks: List of task dictionaries
+        executor: Executor to use instead of the global instance
         
     Returns:
         List of execution results
     """
-    return get_executor().execute_parallel(tasks)
+    return (executor or get_executor()).execute_parallel(tasks)
 
 
 # Command-line interface
 if __name__ == "__main__":
-    import json
     import argparse
     
     parser = argparse.ArgumentParser(description="Claude Code Agent Executor")
@@ -449,11 +690,11 @@ if __name__ == "__main__":
     executor = ClaudeAgentExecutor()
     
     if args.parallel:
-        # Read tasks from stdin
+        # Read tasks from stdin as bytes - both JSON parsers accept them directly
         try:
-            tasks = json.loads(sys.stdin.read())
+            tasks = _json_loads(sys.stdin.buffer.read())
             results = executor.execute_parallel(tasks)
-            print(json.dumps(results, indent=2))
+            _write_json(results)
         except json.JSONDecodeError as e:
             print(f"Error parsing JSON input: {e}", file=sys.stderr)
             sys.exit(1)
@@ -470,7 +711,7 @@ if __name__ == "__main__":
             model=args.model
         )
         
-        print(json.dumps(result, indent=2))
+        _write_json(result)
         
         # Exit with error code if execution failed
         if not result.get("success", False):
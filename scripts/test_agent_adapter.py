@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Tests for agent_adapter's JSON handling. Run: python -m unittest test_agent_adapter"""
+
+import json
+import unittest
+from unittest import mock
+
+import agent_adapter
+from agent_adapter import _json_dumps
+
+
+class JsonDumpsTest(unittest.TestCase):
+    def test_int_keyed_kwargs_dict(self):
+        kwargs = {"weights": {1: 0.5, 2: 0.25}, "retries": {1: "a"}}
+        self.assertEqual(json.loads(_json_dumps(kwargs)), json.loads(json.dumps(kwargs)))
+
+    def test_int_keyed_kwargs_dict_without_orjson(self):
+        kwargs = {"weights": {1: 0.5}}
+        with mock.patch.object(agent_adapter, "orjson", None):
+            self.assertEqual(_json_dumps(kwargs), json.dumps(kwargs))
+
+
+if __name__ == "__main__":
+    unittest.main()
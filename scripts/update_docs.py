@@ -2,109 +2,556 @@
 """
 Daily documentation refresh script using Anthropic API directly.
 More reliable alternative to using Claude CLI in headless mode.
+
+By default all URLs are submitted as one Message Batches job (half the cost of
+individual requests, results within 24 hours). Pass --sync to send concurrent
+requests and get results immediately.
+
+Processed markdown is cached under logs/.cache; a page whose ETag (or
+Last-Modified) is unchanged since the last run is restored from the cache
+without calling the API.
+
+Environment:
+    ANTHROPIC_API_KEY           API key (required)
+    ANTHROPIC_MAX_CONCURRENCY   Maximum in-flight API requests (default: 8)
+    DOCS_TTL_SECONDS            Skip docs written more recently than this
+                                (default: 0, refresh everything)
 """
 
+import argparse
+import asyncio
+import hashlib
+import io
 import os
+import random
 import sys
 import json
-import requests
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import re
 
 # Try to import anthropic, provide helpful message if not installed
 try:
     import anthropic
+    import httpx
 except ImportError:
     print("❌ anthropic package not installed.")
     print("   Run: pip install anthropic")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Seconds between Message Batches status checks
+BATCH_POLL_SECONDS = 20
+
+# Consecutive failed status checks tolerated before giving up on a batch
+BATCH_POLL_MAX_FAILURES = 15
+
+# Retry policy for --sync requests that hit 429/5xx responses
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 1
+BACKOFF_MAX_SECONDS = 60
+
+# System prompt sent with every documentation request
+SYSTEM_PROMPT = "You are a documentation processor. Extract and format documentation content clearly and accurately."
+
+# User prompt for one documentation URL; format with url=
+PROMPT_TEMPLATE = """Please fetch and process this documentation URL: {url}
+
+Extract and format the content as clean markdown with:
+- Source URL at the top
+- Fetch timestamp
+- All key sections preserved
+- Code examples properly formatted
+- Important notes and warnings included
+
+Return ONLY the markdown content, no additional commentary."""
+
+# Marker the model may already put at the top of a doc
+SOURCE_MARKER = "**Source URL:**"
+
+# Write buffer for streamed docs
+STREAM_BUFFER_BYTES = 64 * 1024
+
+# Write buffer for docs written in one piece
+DOC_BUFFER_BYTES = 1 << 20
+
+# Process umask, applied to temp files so replaced docs keep normal permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Timeout for cache validation HEAD requests
+HEAD_TIMEOUT_SECONDS = 10.0
+
+# Processed markdown from earlier runs, keyed by (url, model, prompt)
+CACHE_DIR = Path("logs/.cache")
+
+# Patterns used by slugify
+_URL_PREFIX_RE = re.compile(r'https?://[^/]+/')
+_BAD_CHARS_RE = re.compile(r'[^\w\-]')
+
 def slugify(url: str) -> str:
     """Convert URL to a safe filename."""
     # Remove protocol and domain
-    path = re.sub(r'https?://[^/]+/', '', url)
+    path = _URL_PREFIX_RE.sub('', url)
     # Replace slashes with dashes
     path = path.replace('/', '-')
     # Remove any remaining special characters
-    path = re.sub(r'[^\w\-]', '', path)
+    path = _BAD_CHARS_RE.sub('', path)
     # Add .md extension if not present
     if not path.endswith('.md'):
         path += '.md'
     return path
 
-def fetch_with_anthropic(urls: List[str], docs_dir: str = "docs") -> Dict:
-    """Fetch documentation using Anthropic API."""
+def build_message_params(url: str) -> Dict:
+    """Build the Messages API parameters for one documentation URL."""
+    return {
+        "model": "claude-3-5-sonnet-20241022",
+        "max_tokens": 8192,
+        "temperature": 0,
+        "system": SYSTEM_PROMPT,
+        "messages": [
+            {"role": "user", "content": PROMPT_TEMPLATE.format(url=url)}
+        ]
+    }
+
+def doc_header(url: str) -> str:
+    """Return the source header prepended to docs that lack one."""
+    return f"""{SOURCE_MARKER} {url}
+**Fetch Timestamp:** {datetime.utcnow().isoformat()}Z
+
+"""
+
+def doc_path(url: str, docs_dir: str) -> Path:
+    """Return the markdown path for url, creating its directory."""
+    filepath = Path(docs_dir) / slugify(url)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    return filepath
+
+def temp_path(path: Path) -> Path:
+    """Create a uniquely named empty sibling of path to write before renaming.
     
-    # Get API key from environment
+    Unique names keep concurrent writes to the same doc (duplicate URLs or
+    URLs with the same slug) from sharing one temp file.
+    """
+    fd, name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    # mkstemp creates the file 0600; use the permissions open() would have given
+    os.fchmod(fd, 0o666 & ~_UMASK)
+    os.close(fd)
+    return Path(name)
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path so readers never see a partially written file."""
+    tmp = temp_path(path)
+    try:
+        with open(tmp, 'wb', buffering=DOC_BUFFER_BYTES) as f:
+            f.write(data)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, path)
+
+def save_doc(url: str, content: str, docs_dir: str) -> Path:
+    """Add the source header if missing and write the markdown for url."""
+    # Add header if not present
+    if not content.startswith(SOURCE_MARKER):
+        content = doc_header(url) + content
+    
+    # Save to file
+    filepath = doc_path(url, docs_dir)
+    write_atomic(filepath, content.encode('utf-8'))
+    
+    return filepath
+
+async def stream_doc(client: "anthropic.AsyncAnthropic", url: str, filepath: Path) -> str:
+    """Stream the processed markdown for url straight into filepath.
+    
+    The header is written as soon as the first few characters show whether
+    the model supplied its own. The doc goes to a temporary file that
+    replaces filepath only once the stream completes, so a failed request
+    leaves the previous version in place. Returns the body text for the cache.
+    """
+    parts = []
+    partial = temp_path(filepath)
+    try:
+        await _stream_to(client, url, partial, parts)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    os.replace(partial, filepath)
+    return "".join(parts)
+
+async def _stream_to(client: "anthropic.AsyncAnthropic", url: str, path: Path, parts: List[str]) -> None:
+    """Write the streamed response for url to path, collecting text in parts."""
+    head = ""
+    with open(path, 'w', encoding='utf-8', buffering=STREAM_BUFFER_BYTES) as out:
+        async with client.messages.stream(**build_message_params(url)) as stream:
+            async for text in stream.text_stream:
+                parts.append(text)
+                if head is None:
+                    out.write(text)
+                    continue
+                # Hold back the first characters until the header decision can be made
+                head += text
+                if len(head) >= len(SOURCE_MARKER):
+                    if not head.startswith(SOURCE_MARKER):
+                        out.write(doc_header(url))
+                    out.write(head)
+                    head = None
+        if head is not None:
+            # Response shorter than the marker
+            if not head.startswith(SOURCE_MARKER):
+                out.write(doc_header(url))
+            out.write(head)
+
+def get_docs_ttl() -> int:
+    """Return how many seconds a written doc counts as fresh.
+    
+    Off by default: this script runs daily, so any TTL near 24h would skip
+    docs written by the previous run and refresh them only every other day.
+    Set it well below the schedule interval, e.g. to make quick re-runs cheap.
+    """
+    return int(os.environ.get("DOCS_TTL_SECONDS", "0"))
+
+def fresh_doc(url: str, docs_dir: str, ttl: int) -> Optional[Path]:
+    """Return the doc path for url if it was written within ttl seconds."""
+    filepath = Path(docs_dir) / slugify(url)
+    try:
+        mtime = filepath.stat().st_mtime
+    except OSError:
+        return None
+    return filepath if time.time() - mtime < ttl else None
+
+def cache_key(url: str, params: Dict) -> str:
+    """Return the cache key for a request: url, model and prompt together."""
+    prompt = params["messages"][0]["content"]
+    return hashlib.blake2b(f"{url}|{params['model']}|{prompt}".encode(), digest_size=16).hexdigest()
+
+async def get_validator(http: "httpx.AsyncClient", url: str) -> Optional[str]:
+    """HEAD url and return its ETag (or Last-Modified), or None if unavailable."""
+    try:
+        response = await http.head(url, timeout=HEAD_TIMEOUT_SECONDS)
+    except httpx.HTTPError:
+        return None
+    if response.status_code >= 400:
+        return None
+    return response.headers.get("etag") or response.headers.get("last-modified")
+
+def load_cached(key: str, validator: Optional[str]) -> Optional[str]:
+    """Return cached markdown for key if the upstream page has not changed."""
+    if validator is None:
+        return None
+    try:
+        with open(CACHE_DIR / f"{key}.json", 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("validator") != validator:
+        return None
+    return entry.get("content")
+
+def store_cached(key: str, validator: Optional[str], content: str) -> None:
+    """Remember content for key so unchanged pages skip the API next run."""
+    if validator is None:
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    entry = json.dumps({"validator": validator, "content": content})
+    write_atomic(CACHE_DIR / f"{key}.json", entry.encode('utf-8'))
+
+async def check_cache(http: "httpx.AsyncClient", url: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """Return (cache key, upstream validator, cached markdown or None) for url."""
+    key = cache_key(url, build_message_params(url))
+    validator = await get_validator(http, url)
+    return key, validator, load_cached(key, validator)
+
+def get_api_key() -> Optional[str]:
+    """Return the Anthropic API key, reporting when it is missing."""
     api_key = os.environ.get('ANTHROPIC_API_KEY')
     if not api_key:
         print("❌ ANTHROPIC_API_KEY environment variable not set")
-        return {"error": "Missing API key"}
-    
-    client = anthropic.Anthropic(api_key=api_key)
-    
-    results = {
+    return api_key
+
+def new_results(urls: List[str]) -> Dict:
+    """Create the results summary written to the refresh log."""
+    return {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "urls_processed": len(urls),
         "docs_created": [],
+        "cache_hits": [],
+        "fresh_skipped": [],
         "errors": []
     }
+
+def get_max_concurrency() -> int:
+    """Return the maximum number of in-flight API requests."""
+    return max(1, int(os.environ.get("ANTHROPIC_MAX_CONCURRENCY", "8")))
+
+def new_client(api_key: str) -> Tuple["anthropic.AsyncAnthropic", "httpx.AsyncClient"]:
+    """Create an AsyncAnthropic client with a connection pool sized for the run.
     
-    # Process each URL
-    for url in urls:
-        print(f"📄 Processing: {url}")
-        
-        prompt = f"""Please fetch and process this documentation URL: {url}
+    Returns the client and its underlying httpx client, which is also used for
+    cache validation HEAD requests. Use the AsyncAnthropic client as an async
+    context manager so pooled TCP/TLS connections are reused across all URLs
+    and closed once at the end.
+    """
+    # Room for a HEAD check per API request in flight
+    max_connections = 2 * get_max_concurrency()
+    http_client = anthropic.DefaultAsyncHttpxClient(
+        limits=httpx.Limits(max_connections=max_connections,
+                            max_keepalive_connections=max_connections)
+    )
+    return anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client), http_client
 
-Extract and format the content as clean markdown with:
-- Source URL at the top
-- Fetch timestamp
-- All key sections preserved
-- Code examples properly formatted
-- Important notes and warnings included
+# API error types worth retrying, as reported in the error body
+RETRYABLE_ERROR_TYPES = frozenset(("rate_limit_error", "overloaded_error", "api_error"))
 
-Return ONLY the markdown content, no additional commentary."""
+def error_type(error: Exception) -> Optional[str]:
+    """Return the API error type (e.g. "overloaded_error") from an error's body."""
+    body = getattr(error, "body", None)
+    if not isinstance(body, dict):
+        return None
+    detail = body.get("error", body)
+    return detail.get("type") if isinstance(detail, dict) else None
+
+def is_retryable(error: Exception) -> bool:
+    """Return True for rate limits, overload/server errors and dropped connections."""
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        if error.status_code == 429 or error.status_code >= 500:
+            return True
+        # Errors sent mid-stream arrive as SSE events on a 200 response,
+        # so only the body says whether they are transient
+        return error_type(error) in RETRYABLE_ERROR_TYPES
+    return False
 
+def retry_delay(error: Exception, attempt: int) -> float:
+    """Return seconds to wait before retrying, honoring a retry-after header."""
+    response = getattr(error, "response", None)
+    if response is not None:
         try:
-            message = client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=8192,
-                temperature=0,
-                system="You are a documentation processor. Extract and format documentation content clearly and accurately.",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            
-            content = message.content[0].text
-            
-            # Add header if not present
-            if not content.startswith("**Source URL:**"):
-                header = f"""**Source URL:** {url}
-**Fetch Timestamp:** {datetime.utcnow().isoformat()}Z
+            return max(0.0, float(response.headers.get("retry-after")))
+        except (TypeError, ValueError):
+            pass
+    # Full jitter: uniform over the capped exponential window
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
 
-"""
-                content = header + content
-            
-            # Save to file
-            filename = slugify(url)
-            filepath = Path(docs_dir) / filename
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+async def stream_with_retry(client: "anthropic.AsyncAnthropic", url: str, filepath: Path,
+                            semaphore: asyncio.Semaphore) -> str:
+    """Stream the doc for url, backing off and retrying transient failures."""
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            async with semaphore:
+                return await stream_doc(client, url, filepath)
+        except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+            if attempt == MAX_ATTEMPTS or not is_retryable(e):
+                raise
+            delay = retry_delay(e, attempt)
+            print(f"   ⏳ Retrying {url} in {delay:.1f}s ({attempt}/{MAX_ATTEMPTS - 1}): {e}")
+            # Sleep outside the semaphore so other URLs can use the slot
+            await asyncio.sleep(delay)
+
+async def fetch_with_anthropic(urls: List[str], docs_dir: str = "docs") -> Dict:
+    """Fetch documentation using Anthropic API, processing URLs concurrently."""
+    
+    # Get API key from environment
+    api_key = get_api_key()
+    if not api_key:
+        return {"error": "Missing API key"}
+    
+    # Cap in-flight requests so a long URL list doesn't trip rate limits
+    semaphore = asyncio.Semaphore(get_max_concurrency())
+    
+    results = new_results(urls)
+    ttl = get_docs_ttl()
+    
+    client, http = new_client(api_key)
+    async with client:
+        # Retries are handled by stream_with_retry, not stacked on the SDK's own
+        client = client.with_options(max_retries=0)
+        
+        async def process_one(url: str) -> None:
+            """Fetch a single URL and save it as markdown."""
+            # Buffer this URL's lines so concurrent URLs don't interleave
+            log = io.StringIO()
+            print(f"📄 Processing: {url}", file=log)
             
-            print(f"   ✅ Saved to: {filepath}")
+            try:
+                filepath = fresh_doc(url, docs_dir, ttl)
+                if filepath is not None:
+                    print(f"   ⏭️  Fresh, skipped: {filepath}", file=log)
+                    results["docs_created"].append(str(filepath))
+                    results["fresh_skipped"].append(url)
+                    return
+                
+                key, validator, content = await check_cache(http, url)
+                if content is not None:
+                    filepath = save_doc(url, content, docs_dir)
+                    print(f"   ♻️  Unchanged, reused cache: {filepath}", file=log)
+                    results["docs_created"].append(str(filepath))
+                    results["cache_hits"].append(url)
+                    return
+                
+                filepath = doc_path(url, docs_dir)
+                content = await stream_with_retry(client, url, filepath, semaphore)
+                store_cached(key, validator, content)
+                
+                print(f"   ✅ Saved to: {filepath}", file=log)
+                results["docs_created"].append(str(filepath))
+                
+            except Exception as e:
+                print(f"   ❌ Error ({url}): {str(e)}", file=log)
+                results["errors"].append({
+                    "url": url,
+                    "error": str(e)
+                })
+            finally:
+                sys.stdout.write(log.getvalue())
+        
+        # Feed URLs through a bounded queue to a fixed worker pool rather than
+        # creating a task per URL up front. Twice as many workers as API slots
+        # lets cache checks and retry backoff overlap with in-flight requests.
+        workers = 2 * get_max_concurrency()
+        queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=workers)
+        
+        async def producer() -> None:
+            for url in urls:
+                await queue.put(url)
+            for _ in range(workers):
+                await queue.put(None)
+        
+        async def worker() -> None:
+            while (url := await queue.get()) is not None:
+                await process_one(url)
+        
+        await asyncio.gather(producer(), *(worker() for _ in range(workers)))
+    
+    return results
+
+def record_errors(results: Dict, urls: List[str], error: str, log: Optional[io.StringIO] = None) -> None:
+    """Record the same error for every url that has no result."""
+    for url in urls:
+        print(f"   ❌ Error ({url}): {error}", file=log)
+        results["errors"].append({
+            "url": url,
+            "error": error
+        })
+
+async def fetch_with_batch(urls: List[str], docs_dir: str = "docs") -> Dict:
+    """Fetch documentation through the Message Batches API.
+    
+    Batches are billed at half the price of individual requests but complete
+    asynchronously, so this polls until the batch has ended.
+    """
+    
+    # Get API key from environment
+    api_key = get_api_key()
+    if not api_key:
+        return {"error": "Missing API key"}
+    
+    results = new_results(urls)
+    
+    client, http = new_client(api_key)
+    async with client:
+        log = io.StringIO()
+        
+        # Docs written within the TTL need neither a HEAD nor an API call
+        ttl = get_docs_ttl()
+        stale = []
+        for url in urls:
+            filepath = fresh_doc(url, docs_dir, ttl)
+            if filepath is None:
+                stale.append(url)
+                continue
+            print(f"   ⏭️  Fresh, skipped: {filepath}", file=log)
             results["docs_created"].append(str(filepath))
-            
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            results["errors"].append({
-                "url": url,
-                "error": str(e)
-            })
+            results["fresh_skipped"].append(url)
+        
+        # Reuse cached markdown for pages that haven't changed upstream
+        cached = await asyncio.gather(*(check_cache(http, url) for url in stale))
+        pending = []
+        for url, (key, validator, content) in zip(stale, cached):
+            if content is None:
+                pending.append((url, key, validator))
+                continue
+            filepath = save_doc(url, content, docs_dir)
+            print(f"   ♻️  Unchanged, reused cache: {filepath}", file=log)
+            results["docs_created"].append(str(filepath))
+            results["cache_hits"].append(url)
+        sys.stdout.write(log.getvalue())
+        
+        if not pending:
+            return results
+        
+        # custom_id only allows [a-zA-Z0-9_-], so key requests by position
+        requests_by_id = {f"url-{i}": url for i, (url, _, _) in enumerate(pending)}
+        validators = {url: (key, validator) for url, key, validator in pending}
+        try:
+            batch = await client.messages.batches.create(requests=[
+                {"custom_id": custom_id, "params": build_message_params(url)}
+                for custom_id, url in requests_by_id.items()
+            ])
+        except anthropic.APIError as e:
+            record_errors(results, list(requests_by_id.values()), f"Batch submission failed: {e}")
+            return results
+        results["batch_id"] = batch.id
+        print(f"📦 Submitted batch {batch.id} with {len(pending)} requests")
+        
+        # The batch keeps running server-side, so ride out transient status check failures
+        failures = 0
+        while batch.processing_status != "ended":
+            await asyncio.sleep(BATCH_POLL_SECONDS)
+            try:
+                batch = await client.messages.batches.retrieve(batch.id)
+            except anthropic.APIError as e:
+                failures += 1
+                print(f"   ⚠️  Status check failed ({failures}/{BATCH_POLL_MAX_FAILURES}): {e}")
+                if failures >= BATCH_POLL_MAX_FAILURES:
+                    record_errors(results, list(requests_by_id.values()),
+                                  f"Lost track of batch {batch.id}: {e}")
+                    return results
+                continue
+            failures = 0
+            counts = batch.request_counts
+            print(f"   ⏳ {batch.processing_status}: {counts.processing} processing, "
+                  f"{counts.succeeded} succeeded, {counts.errored} errored")
+        
+        log = io.StringIO()
+        unseen = dict(requests_by_id)
+        try:
+            async for entry in await client.messages.batches.results(batch.id):
+                url = unseen.pop(entry.custom_id)
+                
+                try:
+                    if entry.result.type != "succeeded":
+                        error = getattr(entry.result, "error", None)
+                        raise RuntimeError(f"{entry.result.type}: {error}" if error else entry.result.type)
+                    
+                    content = entry.result.message.content[0].text
+                    filepath = save_doc(url, content, docs_dir)
+                    store_cached(*validators[url], content)
+                    
+                    print(f"   ✅ Saved to: {filepath}", file=log)
+                    results["docs_created"].append(str(filepath))
+                    
+                except Exception as e:
+                    print(f"   ❌ Error ({url}): {str(e)}", file=log)
+                    results["errors"].append({
+                        "url": url,
+                        "error": str(e)
+                    })
+        except anthropic.APIError as e:
+            record_errors(results, list(unseen.values()),
+                          f"Fetching results for batch {batch.id} failed: {e}", log)
+        else:
+            record_errors(results, list(unseen.values()), f"Missing from batch {batch.id} results", log)
+        sys.stdout.write(log.getvalue())
     
     return results
 
@@ -112,8 +559,14 @@ def main():
     """Main execution function."""
     
     # Parse arguments
-    docs_dir = sys.argv[1] if len(sys.argv) > 1 else "docs"
-    urls_file = sys.argv[2] if len(sys.argv) > 2 else "urls.txt"
+    parser = argparse.ArgumentParser(description="Refresh documentation using the Anthropic API")
+    parser.add_argument("docs_dir", nargs="?", default="docs", help="Output directory (default: docs)")
+    parser.add_argument("urls_file", nargs="?", default="urls.txt", help="File with one URL per line (default: urls.txt)")
+    parser.add_argument("--sync", action="store_true",
+                        help="Send requests immediately instead of through the Message Batches API")
+    args = parser.parse_args()
+    docs_dir = args.docs_dir
+    urls_file = args.urls_file
     
     print(f"📅 Documentation Refresh - {datetime.now()}")
     print("━" * 40)
@@ -152,14 +605,20 @@ https://docs.anthropic.com/en/api/streaming
     print()
     
     # Fetch documentation
-    results = fetch_with_anthropic(urls, docs_dir)
+    if args.sync:
+        results = asyncio.run(fetch_with_anthropic(urls, docs_dir))
+    else:
+        results = asyncio.run(fetch_with_batch(urls, docs_dir))
     
     # Save results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     json_output = f"logs/refresh_{timestamp}.json"
     
-    with open(json_output, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        Path(json_output).write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_output, 'w') as f:
+            json.dump(results, f, indent=2)
     
     # Summary
     print()
@@ -167,6 +626,10 @@ https://docs.anthropic.com/en/api/streaming
     print("✅ Refresh complete")
     print(f"📊 Processed: {results['urls_processed']} URLs")
     print(f"✅ Created: {len(results['docs_created'])} documents")
+    if results.get('fresh_skipped'):
+        print(f"⏭️  Skipped: {len(results['fresh_skipped'])} still fresh")
+    if results.get('cache_hits'):
+        print(f"♻️  From cache: {len(results['cache_hits'])} unchanged")
     if results['errors']:
         print(f"❌ Errors: {len(results['errors'])}")
     print(f"📊 Results saved to: {json_output}")